@@ -1,11 +1,15 @@
 import math
-from collections.abc import Hashable
+from collections.abc import Hashable, Mapping, Sized
 from enum import Enum
+from numbers import Integral
 from abc import ABC, abstractmethod
 from types import NoneType
 from typing import Callable, Any, Iterable
 from bisect import bisect_left, bisect_right
-from random import random
+from operator import add, itemgetter, mul
+from random import Random, choices
+from itertools import accumulate, islice
+from concurrent.futures import ProcessPoolExecutor
 import collections
 import heapq
 
@@ -51,15 +55,39 @@ def unique_copy(input_list):
         [1, 2, 5, 4, 3]
 
     """
-    unique_elements = []
-    seen_elements = set()
+    return list(dict.fromkeys(input_list))
 
-    for item in input_list:
-        if item not in seen_elements:
-            unique_elements.append(item)
-            seen_elements.add(item)
 
-    return unique_elements
+def _hashable_items(iterable):
+    """
+    Yield the hashable items of an iterable, warning about and skipping the rest.
+
+    Args:
+        iterable (Iterable): The items to filter.
+
+    Yields:
+        Any: Each hashable item, in the original order.
+    """
+    for item in iterable:
+        if isinstance(item, Hashable):
+            yield item
+        else:
+            print(f"Warning: Skipping non-hashable item: {item}")
+
+
+def _merge_pair(left, right):
+    """
+    Merge `right` into `left` and return `left`; the unit of work for `FrequencyTable.parallel_merge`.
+
+    Args:
+        left (FrequencyTable): The table to merge into.
+        right (FrequencyTable): The table to merge from.
+
+    Returns:
+        FrequencyTable: `left`, holding the combined frequencies.
+    """
+    left.merge(right)
+    return left
 
 
 class FrequencyTable(ABC):
@@ -70,6 +98,8 @@ class FrequencyTable(ABC):
     statistics, filtering, mapping, and more.
     """
 
+    _CHUNK_SIZE = 1 << 16
+
     def __init__(self, data=None):
         """
         Initialize a FrequencyTable.
@@ -77,6 +107,8 @@ class FrequencyTable(ABC):
         :param data: Optional initial data for creating the frequency table.
         """
         self._table = self._calculate_frequencies(data if data is not None else [])
+        self._total = None
+        self._sorted_caches = {}
 
     @abstractmethod
     def _calculate_frequencies(self, data):
@@ -84,7 +116,7 @@ class FrequencyTable(ABC):
         Abstract method for calculating frequencies of data elements.
 
         :param data: The data to calculate frequencies for.
-        :return: A frequency table (dictionary) where keys are elements and values are their frequencies.
+        :return: A frequency table (Counter) where keys are elements and values are their frequencies.
         """
         pass
 
@@ -121,20 +153,13 @@ class FrequencyTable(ABC):
 
         :return: A formatted string representing the frequency table.
         """
-        max_len = 0
-
-        for class_item in self._table:
-            max_len = max(max_len, len(str(class_item)))
-
-        max_len += 7
+        class_strs = [str(class_item) for class_item in self._table]
+        max_len = max(map(len, class_strs), default=0) + 7
 
-        table = ""
-        table = table + f"{'Class':<{max_len}}" + "Frequency"
+        lines = [f"{'Class':<{max_len}}Frequency"]
+        lines.extend(f"{class_str:<{max_len}}{freq}" for class_str, freq in zip(class_strs, self._table.values()))
 
-        for class_item in self._table:
-            table = table + f"\n{str(class_item):<{max_len}}" + str(self._table[class_item])
-
-        return table
+        return "\n".join(lines)
 
     def __len__(self):
         """
@@ -156,27 +181,29 @@ class FrequencyTable(ABC):
         """Print the string representation of the FrequencyTable."""
         print(self.__str__())
 
-    def to_dict(self):
+    def to_dict(self, copy=True):
         """
         Convert the FrequencyTable to a dictionary.
 
+        :param copy: True to return an independent copy, False to return the underlying table without copying.
+            The uncopied table is a Counter (missing elements read as 0) and must be treated as read-only.
         :return: A dictionary representation of the FrequencyTable.
         """
-        return self._table.copy()
+        return dict(self._table) if copy else self._table
 
     def get_data(self):
         """
-        Get a list of unique data elements in the FrequencyTable.
+        Get a view of the unique data elements in the FrequencyTable, without copying them.
 
-        :return: A list of unique data elements.
+        :return: A view of the unique data elements.
         """
         return self._table.keys()
 
     def get_frequencies(self):
         """
-        Get a list of frequencies corresponding to data elements.
+        Get a view of the frequencies corresponding to data elements, without copying them.
 
-        :return: A list of frequencies.
+        :return: A view of the frequencies.
         """
         return self._table.values()
 
@@ -186,7 +213,14 @@ class FrequencyTable(ABC):
 
         :return: The total frequency count.
         """
-        return sum(self._table.values())
+        if self._total is None:
+            self._total = sum(self._table.values())
+        return self._total
+
+    @property
+    def total(self):
+        """The total frequency count of all data elements (cached, see `get_total`)."""
+        return self.get_total()
 
     def sort(self, by=SortType.BY_FREQ, acs=True):
         """
@@ -195,40 +229,97 @@ class FrequencyTable(ABC):
         :param by: Sort by frequency or item (SortType.BY_FREQ or SortType.BY_ITEM).
         :param acs: True for ascending, False for descending.
         :raises InvalidSortTypeError: If an invalid sorting type is specified.
+        :raises TypeError: If the items (or frequencies) cannot be compared with each other.
 
         Example:
         >>> freq_table.sort(by=SortType.BY_FREQ, acs=False)
         """
+        sorted_items = list(self.iter_sorted(by, acs))
+        self._table = collections.Counter(dict(sorted_items))
+        # Ties in the other cached orders followed the previous table order; only this order is still current.
+        self._sorted_caches = {(by, bool(acs)): sorted_items}
+
+    def iter_sorted(self, by=SortType.BY_FREQ, acs=True):
+        """
+        Iterate over the (item, frequency) pairs in sorted order without reordering the FrequencyTable.
+
+        Each order is computed once and cached until the frequencies change, so repeated sorting does not sort
+        again. The sort is stable in both directions: equal keys keep their current table order.
+
+        :param by: Sort by frequency or item (SortType.BY_FREQ or SortType.BY_ITEM).
+        :param acs: True for ascending, False for descending.
+        :return: An iterator over (item, frequency) pairs.
+        :raises InvalidSortTypeError: If an invalid sorting type is specified.
+        :raises TypeError: If the items (or frequencies) cannot be compared with each other.
+
+        Example:
+        >>> for item, freq in freq_table.iter_sorted(by=SortType.BY_ITEM):
+        >>>     print(item, freq)
+        """
         if not isinstance(by, SortType):
             raise InvalidSortTypeError(
                 "Invalid SortType selected. `by` must be either SortType.BY_FREQ or SortType.BY_ITEM.")
-        try:
-            self._table = dict(sorted(self._table.items(), key=lambda item: item[by.value], reverse=not acs))
-        except Exception as e:
-            print(f"An error occurred while sorting: {e}")
+
+        acs = bool(acs)
+        sorted_items = self._sorted_caches.get((by, acs))
+        if sorted_items is None:
+            sorted_items = self._sorted_caches[by, acs] = sorted(self._table.items(), key=itemgetter(by.value),
+                                                                 reverse=not acs)
+
+        return iter(sorted_items)
 
     def append(self, data_to_append: Iterable):
         """
         Append data to the FrequencyTable and update frequencies.
 
-        :param data_to_append: Data to append (an iterable, e.g., list, tuple).
+        :param data_to_append: Data to append (an iterable, e.g., list, tuple). A mapping (e.g., dict, Counter)
+            or a FrequencyTable is taken as already counted, and its frequencies are added directly.
         :raises TypeError: If the data_to_append is not an iterable.
 
         Example:
         >>> freq_table.append([1, 2, 2, 3])
+        >>> freq_table.append(collections.Counter({1: 4, 3: 2}))
         """
+        if isinstance(data_to_append, FrequencyTable):
+            self.merge(data_to_append)
+            return
+
         if not isinstance(data_to_append, Iterable):
             raise TypeError("Invalid data type for `data_to_append`. It must be an iterable (e.g., list, tuple).")
 
-        counter = collections.Counter(data_to_append)
-        for item in counter:
-            if item in self._table:
-                self._table[item] += counter[item]
-            else:
-                if not isinstance(item, Hashable):
-                    print(f"Warning: Skipping non-hashable item: {item}")
-                else:
-                    self._table[item] = counter[item]
+        if isinstance(data_to_append, Mapping):
+            counter = data_to_append
+        elif iter(data_to_append) is data_to_append:
+            # A one-shot iterator cannot be replayed, so it is counted chunk by chunk: errors raised while
+            # iterating come from the caller's data and propagate, and only a chunk that fails to count is recounted.
+            counter = collections.Counter()
+            while chunk := list(islice(data_to_append, self._CHUNK_SIZE)):
+                counter.update(self._count_hashable(chunk))
+        else:
+            counter = self._count_hashable(data_to_append)
+
+        # Sum before updating: `counter` may be this table's own Counter (e.g. from `to_dict(copy=False)`).
+        added = sum(counter.values())
+        self._table.update(counter)
+        self._sorted_caches.clear()
+        if self._total is not None:
+            self._total += added
+
+    @staticmethod
+    def _count_hashable(data: Iterable):
+        """
+        Count re-iterable data, skipping (with a warning) any non-hashable items.
+
+        :param data: The data to count (a re-iterable, e.g., list, tuple).
+        :return: A Counter of the hashable items.
+        :raises TypeError: If counting fails for a reason other than a non-hashable item.
+        """
+        try:
+            return collections.Counter(data)
+        except TypeError:
+            if all(isinstance(item, Hashable) for item in data):
+                raise
+            return collections.Counter(_hashable_items(data))
 
     def merge(self, freqtable: 'FrequencyTable'):
         """
@@ -243,11 +334,71 @@ class FrequencyTable(ABC):
         if not isinstance(freqtable, FrequencyTable):
             raise TypeError("Invalid data type for `freqtable`. It must be a FrequencyTable.")
 
-        for item, freq in freqtable._table.items():
-            if self._table.get(item) is None:
-                self._table[item] = freq
-            else:
-                self._table[item] += freq
+        # Add what was actually merged: a table's total may count more than its stored entries (e.g. a sketch).
+        # Sum before updating, since `freqtable` may be this table.
+        added = sum(freqtable._table.values())
+        self._table.update(freqtable._table)
+        self._sorted_caches.clear()
+        if self._total is not None:
+            self._total += added
+
+    @classmethod
+    def parallel_merge(cls, tables: Iterable['FrequencyTable'], workers=None):
+        """
+        Merge many FrequencyTables into a new one, reducing them pairwise in a tree across worker processes.
+
+        :param tables: The FrequencyTables to merge (an iterable, e.g., list, tuple).
+        :param workers: Maximum number of worker processes; None uses the executor default, 1 merges sequentially.
+            Tables mixing SketchFrequencyTables with other kinds are always merged sequentially.
+        :return: A new FrequencyTable, of the same kind as the first table, containing the combined frequencies.
+            The input tables are left unchanged.
+        :raises TypeError: If any element of tables is not a FrequencyTable.
+        :raises ValueError: If tables is empty.
+
+        Example:
+        >>> merged = DiscreteFrequencyTable.parallel_merge([freq_table_a, freq_table_b, freq_table_c])
+        """
+        tables = list(tables)
+        for freqtable in tables:
+            if not isinstance(freqtable, FrequencyTable):
+                raise TypeError("Invalid data type in `tables`. Every element must be a FrequencyTable.")
+        if len(tables) == 0:
+            raise ValueError("Invalid value for `tables`. It must contain at least one FrequencyTable.")
+
+        merged = tables[0]._empty_like()
+        sketches = sum(isinstance(freqtable, SketchFrequencyTable) for freqtable in tables)
+        # Pickling tables to worker processes only pays off once there is more than one merge to spread. Mixing
+        # sketches with other tables also stays here: merging the two kinds hashes elements, and a worker's string
+        # hashes may differ from this interpreter's.
+        if workers == 1 or len(tables) < 3 or 0 < sketches < len(tables):
+            for freqtable in tables:
+                merged.merge(freqtable)
+            return merged
+
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            while len(tables) > 1:
+                leftover = [tables[-1]] if len(tables) % 2 == 1 else []
+                tables = list(executor.map(_merge_pair, tables[0:-1:2], tables[1::2])) + leftover
+
+        merged.merge(tables[0])
+        return merged
+
+    def _empty_like(self):
+        """
+        Create an empty FrequencyTable configured like this one, so that merging into it is equivalent to merging
+        into this table.
+
+        :return: A new, empty FrequencyTable.
+        """
+        return self.__class__()
+
+    def _derived_table(self):
+        """
+        Create an empty FrequencyTable to hold frequencies derived from this one (filtered subsets, samples).
+
+        :return: A new, empty FrequencyTable.
+        """
+        return self._empty_like()
 
     def filter_by_freq(self, min_frequency: int, max_frequency: int):
         """
@@ -257,11 +408,10 @@ class FrequencyTable(ABC):
         :param max_frequency: Maximum frequency (inclusive).
         :return: A new FrequencyTable containing filtered elements.
         """
-        freqrange = range(min_frequency, max_frequency + 1)
-        freqtable = self.__class__()
+        freqtable = self._derived_table()
 
         for item, freq in self._table.items():
-            if freq in freqrange:
+            if min_frequency <= freq <= max_frequency:
                 freqtable._table[item] = freq
 
         return freqtable
@@ -282,11 +432,11 @@ class FrequencyTable(ABC):
         if not callable(predicate):
             raise TypeError("Invalid predicate function. It must be a callable function.")
 
-        freqtable = self.__class__()
+        freqtable = self._derived_table()
         for item, freq in self._table.items():
             try:
                 if predicate(item, freq):
-                    freqtable.append([item] * freq)
+                    freqtable._table[item] = freq
             except Exception as e:
                 print(f"An error occurred while applying the predicate function: {e}")
 
@@ -306,7 +456,7 @@ class FrequencyTable(ABC):
         if not isinstance(subset_elements, Iterable):
             raise TypeError("Invalid data type for `subset_elements`. It must be an iterable (e.g., list, tuple).")
 
-        freqtable = self.__class__()
+        freqtable = self._derived_table()
         for element in subset_elements:
             freq = self._table.get(element)
             if freq is not None:
@@ -325,8 +475,8 @@ class FrequencyTable(ABC):
         if n <= 0:
             raise ValueError("Invalid value for `n`. It must be greater than 0.")
 
-        freqtable = self.__class__()
-        top_n_elements = heapq.nlargest(n, self._table.items(), lambda item: item[1])
+        freqtable = self._derived_table()
+        top_n_elements = self._table.most_common(n)
 
         for item, freq in top_n_elements:
             freqtable._table[item] = freq
@@ -344,8 +494,8 @@ class FrequencyTable(ABC):
         if n <= 0:
             raise ValueError("Invalid value for `n`. It must be greater than 0.")
 
-        freqtable = self.__class__()
-        lowest_n_elements = heapq.nsmallest(n, self._table.items(), lambda item: item[1])
+        freqtable = self._derived_table()
+        lowest_n_elements = heapq.nsmallest(n, self._table.items(), itemgetter(1))
 
         for item, freq in lowest_n_elements:
             freqtable._table[item] = freq
@@ -368,18 +518,17 @@ class FrequencyTable(ABC):
         if not callable(func):
             raise TypeError("Invalid mapping function. It must be a callable function.")
 
-        items = list(self._table.keys())
-        for item in items:
+        new_table = collections.Counter()
+        for item, freq in self._table.items():
             try:
                 new_item = func(item)
-                freq = self._table[item]
-                self._table.pop(item)
-                if self._table.get(new_item) is not None:
-                    self._table[new_item] += freq
-                else:
-                    self._table[new_item] = freq
             except Exception as e:
                 print(f"An error occurred while mapping elements: {e}")
+                new_item = item
+            new_table[new_item] += freq
+
+        self._table = new_table
+        self._sorted_caches.clear()
 
     def apply_frequency_operation(self, func: Callable[[Any], Any]):
         """
@@ -397,20 +546,16 @@ class FrequencyTable(ABC):
         if not callable(func):
             raise TypeError("Invalid mapping function. It must be a callable function.")
 
-        items_with_neg_freq = []
-        for item, freq in self._table.items():
-            newfreq = func(freq)
-            try:
-                if newfreq <= 0:
-                    raise ValueError(f"Warning: {item} deleted since its new frequency, {newfreq} <= 0")
-            except ValueError as e:
-                print(e)
-                items_with_neg_freq.append(item)
+        new_table = collections.Counter()
+        for item, newfreq in zip(self._table, map(func, self._table.values())):
+            if newfreq <= 0:
+                print(f"Warning: {item} deleted since its new frequency, {newfreq} <= 0")
             else:
-                self._table[item] = newfreq
+                new_table[item] = newfreq
 
-        for item in items_with_neg_freq:
-            self._table.pop(item)
+        self._table = new_table
+        self._sorted_caches.clear()
+        self._total = None
 
     def generate_random_data(self, sample_size: int):
         """
@@ -427,24 +572,9 @@ class FrequencyTable(ABC):
         if len(self) == 0:
             raise ValueError("Frequency table is empty. Cannot generate random data from an empty FrequencyTable.")
 
-        items = list(self.get_data())
-        relative_freqs = [freq / self.get_total() for freq in self.get_frequencies()]
-
-        commutative_rfreqs = [relative_freqs[0]]
-
-        for i in range(1, len(relative_freqs)):
-            commutative_rfreqs.append(commutative_rfreqs[-1] + relative_freqs[i])
-
-        freqt = self.__class__()
-        for i in range(sample_size):
-            try:
-                rand = random()
-                element_index = bisect_left(commutative_rfreqs, rand)
-                if element_index < 0:
-                    raise ValueError("Error in generating random data.")
-                freqt.append([items[element_index]])
-            except (ValueError, IndexError):
-                print("An error occurred while generating random data. Retry or check input data.")
+        freqt = self._derived_table()
+        cum_freqs = list(accumulate(self.get_frequencies()))
+        freqt._table.update(choices(list(self.get_data()), cum_weights=cum_freqs, k=sample_size))
 
         return freqt
 
@@ -462,20 +592,22 @@ class DiscreteFrequencyTable(FrequencyTable):
 
     def __init__(self, data=None):
         super().__init__(data)
+        if isinstance(data, Sized) and not isinstance(data, Mapping):
+            # Every element was counted exactly once, so the total is known without summing the table.
+            self._total = len(data)
 
     def _calculate_frequencies(self, data: Iterable):
         """
         Calculate frequencies of discrete data elements.
 
         :param data: The data to calculate frequencies for (an iterable, e.g., list, tuple).
-        :return: A frequency table (dictionary) where keys are elements and values are their frequencies.
+        :return: A frequency table (Counter) where keys are elements and values are their frequencies.
         """
         if not isinstance(data, Iterable):
             raise TypeError(f"Invalid data type for `data`. It must be an iterable (e.g., list, tuple). "
                             f"but found {type(data)}")
 
-        counter = collections.Counter(data)
-        return dict(counter.items())
+        return collections.Counter(data)
 
     def mean(self):
         """
@@ -487,11 +619,7 @@ class DiscreteFrequencyTable(FrequencyTable):
         if len(self) == 0:
             raise ValueError("Cannot calculate mean for an empty frequency table.")
 
-        sum = 0
-        for item, freq in self._table.items():
-            sum += item * freq
-
-        return sum / self.get_total()
+        return sum(map(mul, self._table.keys(), self._table.values())) / self.get_total()
 
     def median(self):
         """
@@ -503,14 +631,16 @@ class DiscreteFrequencyTable(FrequencyTable):
         if len(self) == 0:
             raise ValueError("Cannot calculate median for an empty frequency table.")
 
-        items = []
-        for item, freq in self._table.items():
-            items.extend([item] * freq)
+        total = self.get_total()
+        lower_mid, upper_mid = (total - 1) // 2, total // 2
 
-        items.sort()
+        # Search the cumulative frequencies of the sorted unique items instead of expanding the data.
+        items, freqs = zip(*self.iter_sorted(SortType.BY_ITEM))
+        cumfreqs = list(accumulate(freqs))
+        lower_item = items[bisect_right(cumfreqs, lower_mid)]
+        upper_item = items[bisect_right(cumfreqs, upper_mid)]
 
-        return items[int(self.get_total() / 2)] if self.get_total() % 2 == 1 else (
-                (items[int(self.get_total() / 2)] + items[int(self.get_total() / 2) - 1]) / 2)
+        return upper_item if lower_mid == upper_mid else (lower_item + upper_item) / 2
 
     def mode(self):
         """
@@ -521,7 +651,7 @@ class DiscreteFrequencyTable(FrequencyTable):
         """
         if len(self) == 0:
             raise ValueError("Cannot calculate mode for an empty frequency table.")
-        return list(self.get_top_n_elements(1).get_data())[0]
+        return self._table.most_common(1)[0][0]
 
 
 class EqualClassLengthFrequencyTable(FrequencyTable):
@@ -529,48 +659,53 @@ class EqualClassLengthFrequencyTable(FrequencyTable):
         super().__init__([data if data is not None else [], cut_points])
 
     def _calculate_frequencies(self, data):
-        if not isinstance(data, Iterable):
+        if not isinstance(data[0], Iterable):
             raise TypeError(f"Invalid data type for 'data'. "
                             f"It must be an iterable (e.g., list, tuple), but found {type(data[0])}")
         if not isinstance(data[1], Iterable) and data[1] is not None:
             raise TypeError(f"Invalid data type for 'cut_points'. "
                             f"It must be an iterable (e.g., list, tuple), but found {type(data[1])}")
 
-        if len(data[0]) == 0:
-            return {}
-
+        # Sorting is the only pass over the raw data, so any iterable (including a generator) can be binned.
         sorted_data = sorted(data[0])
+        if len(sorted_data) == 0:
+            return collections.Counter()
 
-        cut_points = sorted(list(set(data[1]))) if data[1] is not None else None
+        # The classes are integer ranges, so every value must be an integer to fall inside exactly one of them.
+        for value in sorted_data:
+            if not isinstance(value, Integral):
+                raise TypeError(f"Invalid data for 'data'. It must contain only integer values, "
+                                f"but found {type(value)}")
+
+        cut_points = sorted(set(data[1])) if data[1] is not None else None
 
         if cut_points is None:
-            k = math.ceil(len(sorted_data) ** 0.5)
+            k = math.isqrt(len(sorted_data) - 1) + 1
             cut_points = EqualClassLengthFrequencyTable.equal_length_cut_points(
                 k,
                 sorted_data[0],
                 sorted_data[-1]
             )
         elif len(cut_points) == 0: # set default interval [min(data), max(data)] if not specified at all
-            cut_points = [min(data[0]), max(data[0]) + 1]
+            cut_points = [sorted_data[0], sorted_data[-1] + 1]
 
 
+        # Widen the classes to cover the data at both ends, so no value falls outside every class.
+        if cut_points[0] > sorted_data[0]:
+            cut_points.insert(0, sorted_data[0])
         if cut_points[-1] <= sorted_data[-1]:
             cut_points.append(sorted_data[-1] + 1)
 
-        cumfreqs = []
-        freqsum = 0
-        for cut_point in cut_points:
-            cumfreqs.append(bisect_left(sorted_data, cut_point) - freqsum)
-            freqsum += cumfreqs[-1]
-        cumfreqs.pop(0)
+        # The frequency of each class is the distance between the positions of its bounds in the sorted data.
+        positions = [bisect_left(sorted_data, cut_point) for cut_point in cut_points]
 
-        table = {}
+        table = collections.Counter()
         for i in range(1, len(cut_points)):
-            table[range(cut_points[i - 1], cut_points[i])] = cumfreqs[i - 1]
+            table[range(cut_points[i - 1], cut_points[i])] = positions[i] - positions[i - 1]
         return table
 
     def get(self):
-        return self._table
+        return dict(self._table)
 
     def mean(self):
         return 0
@@ -607,6 +742,311 @@ class EqualClassLengthFrequencyTable(FrequencyTable):
         if k <= 0:
             raise ValueError(f"Invalid number of classes. k = {k}.")
         r = _to - _from
-        class_length = math.ceil(r / k)
+        class_length = -(-r // k)
         return [_from + i * class_length for i in range(0, k)]
 
+
+
+class SketchFrequencyTable(FrequencyTable):
+    """
+    Subclass of FrequencyTable that estimates frequencies in bounded memory, for data with a huge number of
+    unique elements.
+
+    Every element is counted in a Count-Min sketch of ceil(ln(1 / delta)) rows by ceil(e / epsilon) columns, and
+    only the ceil(1 / epsilon) elements with the highest estimated frequencies (the heavy-hitter candidates) are
+    kept in the table itself. An estimate never undercounts, and with probability at least 1 - delta it overcounts
+    by at most epsilon * total.
+
+    Elements are placed with Python's hash(), and string hashes differ between interpreters. Data, including a
+    non-sketch FrequencyTable merged in, should therefore only be added to a sketch in the interpreter that created
+    it. Merging two sketches does not rehash, so `parallel_merge` merges sketches mixed with other tables sequentially,
+    and only sends them to worker processes when every table is a sketch.
+
+    Tables derived from a sketch (filtering, subsets, top/lowest n, random samples) are exact
+    DiscreteFrequencyTables of the estimated frequencies they select.
+
+    Usage:
+        You can create an instance of SketchFrequencyTable to find the most frequent elements of a large stream.
+
+    Example:
+        sketch_freq_table = SketchFrequencyTable(data=stream, epsilon=0.001, delta=0.01)
+    """
+
+    _MERSENNE_PRIME = (1 << 61) - 1
+
+    def __init__(self, data=None, epsilon=0.01, delta=0.01, seed=0):
+        """
+        Initialize a SketchFrequencyTable.
+
+        :param data: Optional initial data for creating the frequency table (an iterable, e.g., list, generator).
+        :param epsilon: Relative error bound of the frequency estimates, in (0, 1).
+        :param delta: Probability that an estimate exceeds the error bound, in (0, 1).
+        :param seed: Seed of the row hash functions; only sketches with equal parameters and seed can be merged.
+        :raises ValueError: If epsilon or delta is not in (0, 1).
+        """
+        if not 0 < epsilon < 1:
+            raise ValueError(f"Invalid value for `epsilon`. It must be in (0, 1), but found {epsilon}.")
+        if not 0 < delta < 1:
+            raise ValueError(f"Invalid value for `delta`. It must be in (0, 1), but found {delta}.")
+
+        self._epsilon = epsilon
+        self._delta = delta
+        self._seed = seed
+        self._width = math.ceil(math.e / epsilon)
+        self._capacity = math.ceil(1 / epsilon)
+
+        rng = Random(seed)
+        self._hash_params = [(rng.randrange(1, self._MERSENNE_PRIME), rng.randrange(self._MERSENNE_PRIME))
+                             for _ in range(math.ceil(math.log(1 / delta)))]
+        self._counts = [[0] * self._width for _ in self._hash_params]
+        self._stream_total = 0
+        self._candidate_columns = {}
+        self._heap = []
+        self._heap_seq = 0
+
+        super().__init__(data)
+
+    def _calculate_frequencies(self, data: Iterable):
+        """
+        Count data into the sketch, chunk by chunk, and collect the heavy-hitter candidates.
+
+        :param data: The data to calculate frequencies for (an iterable, e.g., list, generator).
+        :return: A frequency table (Counter) of the candidates and their estimated frequencies.
+        """
+        if not isinstance(data, Iterable):
+            raise TypeError(f"Invalid data type for `data`. It must be an iterable (e.g., list, tuple). "
+                            f"but found {type(data)}")
+
+        candidates = collections.Counter()
+        self._add_data(data, candidates)
+        return candidates
+
+    def _add_data(self, data: Iterable, candidates):
+        """
+        Count raw data into the sketch in bounded chunks, so memory does not grow with the number of unique elements.
+
+        :param data: The data to count (an iterable, e.g., list, generator).
+        :param candidates: The candidate table to update.
+        """
+        iterator = iter(data)
+        while chunk := list(islice(iterator, self._CHUNK_SIZE)):
+            self._add_counts(collections.Counter(chunk), candidates)
+
+    def _columns(self, item):
+        """
+        Get the column `item` falls into in each row of the sketch.
+
+        :param item: The element to place.
+        :return: A tuple with one column index per row.
+        """
+        h = hash(item)
+        return tuple((a * h + b) % self._MERSENNE_PRIME % self._width for a, b in self._hash_params)
+
+    def _estimate_columns(self, columns):
+        """
+        Get the Count-Min estimate stored at the given columns.
+
+        :param columns: One column index per row, as returned by `_columns`.
+        :return: The estimated frequency.
+        """
+        return min(row[column] for row, column in zip(self._counts, columns))
+
+    def _add_counts(self, counts: Mapping, candidates):
+        """
+        Add already counted elements to the sketch and offer them as heavy-hitter candidates.
+
+        :param counts: A mapping of elements to the number of times they occurred.
+        :param candidates: The candidate table to update.
+        """
+        for item, count in counts.items():
+            columns = self._columns(item)
+            for row, column in zip(self._counts, columns):
+                row[column] += count
+            self._stream_total += count
+            self._offer(item, columns, self._estimate_columns(columns), candidates)
+
+    def _offer(self, item, columns, estimate, candidates):
+        """
+        Keep `item` as a candidate if there is room, or if it beats the lowest current candidate (Space-Saving).
+
+        :param item: The element to offer.
+        :param columns: The element's columns in the sketch.
+        :param estimate: The element's current estimated frequency.
+        :param candidates: The candidate table to update.
+        """
+        if item not in candidates and len(candidates) >= self._capacity:
+            lowest_estimate, _, lowest_item = self._lowest_candidate(candidates)
+            if estimate <= lowest_estimate:
+                return
+            heapq.heappop(self._heap)
+            del candidates[lowest_item]
+            del self._candidate_columns[lowest_item]
+
+        candidates[item] = estimate
+        self._candidate_columns[item] = columns
+        self._heap_seq += 1
+        heapq.heappush(self._heap, (estimate, self._heap_seq, item))
+        if len(self._heap) > 2 * self._capacity:
+            # Re-offered candidates leave outdated entries behind; drop them so the heap stays bounded.
+            self._rebuild_heap(candidates)
+
+    def _lowest_candidate(self, candidates):
+        """
+        Get the heap entry of the candidate with the lowest estimate, discarding outdated entries.
+
+        :param candidates: The candidate table the heap tracks.
+        :return: An (estimate, sequence number, item) tuple.
+        """
+        while True:
+            estimate, _, item = self._heap[0]
+            if candidates.get(item) == estimate:
+                return self._heap[0]
+            heapq.heappop(self._heap)
+
+    def _rebuild_heap(self, candidates):
+        """
+        Rebuild the candidate heap with exactly one entry per candidate.
+
+        :param candidates: The candidate table the heap tracks.
+        """
+        self._heap = [(estimate, seq, item) for seq, (item, estimate) in enumerate(candidates.items())]
+        self._heap_seq = len(self._heap)
+        heapq.heapify(self._heap)
+
+    def _empty_like(self):
+        """
+        Create an empty SketchFrequencyTable with the same epsilon, delta and seed, so the two can be merged.
+
+        :return: A new, empty SketchFrequencyTable.
+        """
+        return self.__class__(epsilon=self._epsilon, delta=self._delta, seed=self._seed)
+
+    def _derived_table(self):
+        """
+        Create an empty exact table for frequencies derived from this sketch.
+
+        A subset of the candidates, or a sample drawn from them, has no count matrix of its own, so it is returned
+        as a DiscreteFrequencyTable of the estimated frequencies.
+
+        :return: A new, empty DiscreteFrequencyTable.
+        """
+        return DiscreteFrequencyTable()
+
+    def estimate(self, item):
+        """
+        Estimate the frequency of an element, whether or not it is a heavy-hitter candidate.
+
+        :param item: The element to look up.
+        :return: The estimated frequency.
+        """
+        columns = self._candidate_columns.get(item)
+        return self._estimate_columns(columns if columns is not None else self._columns(item))
+
+    def get_total(self):
+        """
+        Get the total frequency count of all data elements seen by the sketch (exact).
+
+        :return: The total frequency count.
+        """
+        return self._stream_total
+
+    def append(self, data_to_append: Iterable):
+        """
+        Append data to the SketchFrequencyTable and update the estimates.
+
+        :param data_to_append: Data to append (an iterable, e.g., list, generator). A mapping (e.g., dict, Counter)
+            or a FrequencyTable is taken as already counted, and its frequencies are added directly.
+        :raises TypeError: If the data_to_append is not an iterable.
+        """
+        if isinstance(data_to_append, FrequencyTable):
+            self.merge(data_to_append)
+            return
+
+        if not isinstance(data_to_append, Iterable):
+            raise TypeError("Invalid data type for `data_to_append`. It must be an iterable (e.g., list, tuple).")
+
+        if isinstance(data_to_append, Mapping):
+            self._add_counts(data_to_append, self._table)
+        else:
+            self._add_data(data_to_append, self._table)
+        self._sorted_caches.clear()
+
+    def merge(self, freqtable: 'FrequencyTable'):
+        """
+        Merge another FrequencyTable into this SketchFrequencyTable.
+
+        Two sketches are merged by adding their count matrices element-wise, and the union of their candidates is
+        re-estimated against the result; any other FrequencyTable is added as already counted data. The latter
+        hashes its elements, so it must happen in the interpreter that created this sketch.
+
+        :param freqtable: Another FrequencyTable to merge.
+        :raises TypeError: If freqtable is not a FrequencyTable.
+        :raises ValueError: If freqtable is a SketchFrequencyTable with different epsilon, delta or seed.
+        """
+        if not isinstance(freqtable, FrequencyTable):
+            raise TypeError("Invalid data type for `freqtable`. It must be a FrequencyTable.")
+
+        if not isinstance(freqtable, SketchFrequencyTable):
+            self._add_counts(freqtable._table, self._table)
+            self._sorted_caches.clear()
+            return
+
+        if (self._epsilon, self._delta, self._seed) != (freqtable._epsilon, freqtable._delta, freqtable._seed):
+            raise ValueError("Cannot merge sketches built with different `epsilon`, `delta` or `seed`.")
+
+        for row, other_row in zip(self._counts, freqtable._counts):
+            row[:] = map(add, row, other_row)
+        self._stream_total += freqtable._stream_total
+
+        columns = {**freqtable._candidate_columns, **self._candidate_columns}
+        estimates = {item: self._estimate_columns(item_columns) for item, item_columns in columns.items()}
+        self._table = collections.Counter(dict(heapq.nlargest(self._capacity, estimates.items(), itemgetter(1))))
+        self._candidate_columns = {item: columns[item] for item in self._table}
+        self._rebuild_heap(self._table)
+        self._sorted_caches.clear()
+
+    def map_elements(self, func: Callable[[Any], Any]):
+        """
+        Mapping elements is not supported: the sketch cannot move counts between elements it does not store.
+
+        :param func: A callable function that takes an element as input and returns a new element.
+        :raises TypeError: Always, since a SketchFrequencyTable cannot be remapped.
+        """
+        raise TypeError("Cannot map the elements of a SketchFrequencyTable, since it does not keep every element.")
+
+    def apply_frequency_operation(self, func: Callable[[Any], Any]):
+        """
+        Frequency operations are not supported: the sketch cannot rewrite the counts of elements it does not store.
+
+        :param func: A callable function that takes a frequency as input and returns a new frequency.
+        :raises TypeError: Always, since the counts of a SketchFrequencyTable cannot be rewritten.
+        """
+        raise TypeError("Cannot apply a frequency operation to a SketchFrequencyTable, "
+                        "since it does not keep every element.")
+
+    def mean(self):
+        """
+        The mean cannot be calculated from a sketch, which does not keep every element.
+
+        :raises TypeError: Always, since a SketchFrequencyTable has no mean.
+        """
+        raise TypeError("Cannot calculate mean for a SketchFrequencyTable, since it does not keep every element.")
+
+    def median(self):
+        """
+        The median cannot be calculated from a sketch, which does not keep every element.
+
+        :raises TypeError: Always, since a SketchFrequencyTable has no median.
+        """
+        raise TypeError("Cannot calculate median for a SketchFrequencyTable, since it does not keep every element.")
+
+    def mode(self):
+        """
+        Estimate the mode of the data as the candidate with the highest estimated frequency.
+
+        :return: The estimated mode of the data.
+        :raises ValueError: If the frequency table is empty.
+        """
+        if len(self) == 0:
+            raise ValueError("Cannot calculate mode for an empty frequency table.")
+        return self._table.most_common(1)[0][0]
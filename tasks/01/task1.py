@@ -1,4 +1,6 @@
 from collections import Counter
+from fractions import Fraction
+from itertools import chain
 from typing import Iterable, Union
 import math
 
@@ -13,7 +15,7 @@ def mean(l: Iterable[Union[int, float]]) -> float:
     Returns:
         float: The mean of the input list.
     """
-    return sum(l) / len(l)
+    return math.fsum(l) / len(l)
 
 
 def percentile(l: Iterable[Union[int, float]], p):
@@ -22,16 +24,17 @@ def percentile(l: Iterable[Union[int, float]], p):
 
     Args:
         l (Iterable[Union[int, float]]): List of numbers.
-        p (float): The percentile value (0.0 to 1.0).
+        p (Fraction): The percentile value (0 to 1). A float is taken as its nearest simple fraction.
 
     Returns:
         float: The p-th percentile of the input list.
     """
-    p *= len(l)
-    if p.is_integer():
-        return (l[int(p)] + l[int(p) - 1]) / 2
+    p = Fraction(p).limit_denominator()
+    index, remainder = divmod(p.numerator * len(l), p.denominator)
+    if remainder == 0:
+        return (l[max(index - 1, 0)] + l[min(index, len(l) - 1)]) / 2
     else:
-        return l[math.floor(p)]
+        return l[index]
 
 
 def S(l: Iterable[Union[int, float]]):
@@ -45,28 +48,29 @@ def S(l: Iterable[Union[int, float]]):
         float: The sample variance of the input list.
     """
     x = mean(l)
-    squared_diff_sum = sum((i - x) ** 2 for i in l)
+    squared_diff_sum = math.fsum((i - x) ** 2 for i in l)
     return squared_diff_sum / (len(l) - 1)
 
 
-with open("01data") as data:
-    try:
-        arr = list(map(int, data.readline().split()))
-        arr.sort()
-    except Exception as e:
-        print(e)
-
-counter = Counter(arr)
-mode = counter.most_common(1)
-x = mean(arr)
-median = percentile(arr, 0.5)
-var = S(arr)
-
-print(f"Sample Mean: {x}")
-print(f"Sample Mode: {'∅' if mode == 1 and len(arr) > 1 else mode[0][0]}")
-print(f"Sample Median: {median}")
-print(f"Sample's 73rd percentile: {percentile(arr, 73 / 100)}")
-print(f"Sample's 20th percentile: {percentile(arr, 20 / 100)}")
-print(f"Sample variance: {var:.2f}")
-print(f"Population standard deviation: {var * (len(arr) - 1) / len(arr):.2f}")
-print(f"Sample IQR: {percentile(arr, 0.75) - percentile(arr, 0.25)}")
+if __name__ == "__main__":
+    with open("01data") as data:
+        try:
+            arr = list(map(int, chain.from_iterable(map(str.split, data))))
+            arr.sort()
+        except Exception as e:
+            print(e)
+
+    counter = Counter(arr)
+    mode = counter.most_common(1)
+    x = mean(arr)
+    p20, p25, median, p73, p75 = (percentile(arr, Fraction(p, 100)) for p in (20, 25, 50, 73, 75))
+    var = S(arr)
+
+    print(f"Sample Mean: {x}")
+    print(f"Sample Mode: {'∅' if mode == 1 and len(arr) > 1 else mode[0][0]}")
+    print(f"Sample Median: {median}")
+    print(f"Sample's 73rd percentile: {p73}")
+    print(f"Sample's 20th percentile: {p20}")
+    print(f"Sample variance: {var:.2f}")
+    print(f"Population standard deviation: {var * (len(arr) - 1) / len(arr):.2f}")
+    print(f"Sample IQR: {p75 - p25}")
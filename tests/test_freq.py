@@ -0,0 +1,118 @@
+import importlib.util
+import unittest
+from fractions import Fraction
+from pathlib import Path
+from unittest import mock
+
+from DescriptiveStatistics.freqtable import freq
+from DescriptiveStatistics.freqtable.freq import (DiscreteFrequencyTable, EqualClassLengthFrequencyTable,
+                                                  FrequencyTable, SketchFrequencyTable, SortType)
+
+
+class TestParallelMerge(unittest.TestCase):
+    def test_merges_all_tables(self):
+        tables = [DiscreteFrequencyTable([1, 2, 2]), DiscreteFrequencyTable([2, 3]), DiscreteFrequencyTable([3])]
+        merged = DiscreteFrequencyTable.parallel_merge(tables, workers=2)
+        self.assertEqual(merged.to_dict(), {1: 1, 2: 3, 3: 2})
+        self.assertEqual([table.get_total() for table in tables], [3, 2, 1])
+
+    def test_empty_tables_raise_value_error(self):
+        for cls in (FrequencyTable, DiscreteFrequencyTable):
+            with self.assertRaises(ValueError):
+                cls.parallel_merge([])
+
+    def test_mixed_sketches_merge_sequentially(self):
+        tables = [SketchFrequencyTable([1, 2]), DiscreteFrequencyTable([2, 3]), DiscreteFrequencyTable([3])]
+        with mock.patch.object(freq, "ProcessPoolExecutor", side_effect=AssertionError("used worker processes")):
+            merged = FrequencyTable.parallel_merge(tables, workers=2)
+        self.assertIsInstance(merged, SketchFrequencyTable)
+        self.assertEqual(merged.to_dict(), {1: 1, 2: 2, 3: 2})
+
+
+class TestToDict(unittest.TestCase):
+    def test_returns_a_plain_dict(self):
+        table = DiscreteFrequencyTable([1, 2, 2])
+        for result in (table.to_dict(), EqualClassLengthFrequencyTable([1, 2, 2]).get()):
+            self.assertIs(type(result), dict)
+            with self.assertRaises(KeyError):
+                result[5]
+
+
+class TestSelfMerge(unittest.TestCase):
+    def test_merge_with_itself_doubles_the_total(self):
+        table = DiscreteFrequencyTable([1, 2, 3, 3])
+        table.merge(table)
+        self.assertEqual(table.to_dict(), {1: 2, 2: 2, 3: 4})
+        self.assertEqual(table.get_total(), 8)
+        self.assertEqual(table.mean(), 2.25)
+
+    def test_append_own_table_doubles_the_total(self):
+        for data in (lambda t: t, lambda t: t.to_dict(copy=False)):
+            table = DiscreteFrequencyTable([1, 2, 3, 3])
+            table.append(data(table))
+            self.assertEqual(table.get_total(), 8)
+            self.assertEqual(table.mean(), 2.25)
+
+
+class TestAppend(unittest.TestCase):
+    def test_skips_non_hashable_items(self):
+        for data in ([1, [2], 3], iter([1, [2], 3])):
+            table = DiscreteFrequencyTable([1])
+            table.append(data)
+            self.assertEqual(table.to_dict(), {1: 2, 3: 1})
+            self.assertEqual(table.get_total(), 3)
+
+    def test_errors_from_the_data_propagate(self):
+        table = DiscreteFrequencyTable([1])
+        with self.assertRaises(TypeError):
+            table.append(x + "a" if x == 2 else x for x in [1, 2, 3])
+        self.assertEqual(table.to_dict(), {1: 1})
+
+
+class TestSort(unittest.TestCase):
+    def test_descending_sort_is_stable(self):
+        table = DiscreteFrequencyTable(['a', 'b', 'c', 'c'])
+        self.assertEqual([item for item, _ in table.iter_sorted(acs=False)], ['c', 'a', 'b'])
+        table.sort(acs=False)
+        self.assertEqual(list(table.get_data()), ['c', 'a', 'b'])
+        table.sort(by=SortType.BY_ITEM, acs=False)
+        self.assertEqual(list(table.get_data()), ['c', 'b', 'a'])
+
+
+class TestMapElements(unittest.TestCase):
+    def test_maps_each_item_once(self):
+        table = DiscreteFrequencyTable([1, 2])
+        table.map_elements(lambda x: x + 1)
+        self.assertEqual(table.to_dict(), {2: 1, 3: 1})
+
+
+class TestEqualClassLengthCutPoints(unittest.TestCase):
+    def test_covers_values_below_the_first_cut_point(self):
+        table = EqualClassLengthFrequencyTable([1, 2, 3, 8, 9], cut_points=[5, 10])
+        self.assertEqual(table.get(), {range(1, 5): 3, range(5, 10): 2})
+        self.assertEqual(table.get_total(), 5)
+
+
+class TestEqualClassLengthValidation(unittest.TestCase):
+    def test_rejects_non_integer_data(self):
+        for data in ([1.5, 2.5], [1, 2.5, 3], [1.0, 2, 3], ["a", "b"], [None], 5):
+            with self.assertRaises(TypeError):
+                EqualClassLengthFrequencyTable(data)
+
+
+class TestTaskPercentile(unittest.TestCase):
+    def setUp(self):
+        spec = importlib.util.spec_from_file_location(
+            "task1", Path(__file__).resolve().parent.parent / "tasks" / "01" / "task1.py")
+        self.task1 = importlib.util.module_from_spec(spec)
+        spec.loader.exec_module(self.task1)
+
+    def test_exact_position_averages_neighbours(self):
+        data = list(range(1, 11))
+        self.assertEqual(self.task1.percentile(data, 0.7), 7.5)
+        self.assertEqual(self.task1.percentile(data, Fraction(7, 10)), 7.5)
+        self.assertEqual(self.task1.percentile(data, Fraction(73, 100)), 8)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,101 @@
+import collections
+import random
+import unittest
+
+from DescriptiveStatistics.freqtable.freq import DiscreteFrequencyTable, SketchFrequencyTable
+
+
+def _skewed_data(seed=1, size=50000):
+    rng = random.Random(seed)
+    data = [rng.randrange(100000) for _ in range(size)] + [7] * 3000 + [8] * 2000 + ["x"] * 1500
+    rng.shuffle(data)
+    return data
+
+
+class TestSketchFrequencyTable(unittest.TestCase):
+    def setUp(self):
+        self.data = _skewed_data()
+        self.exact = collections.Counter(self.data)
+        self.sketch = SketchFrequencyTable(iter(self.data), epsilon=0.01, delta=0.01)
+
+    def test_total_is_exact(self):
+        self.assertEqual(self.sketch.get_total(), len(self.data))
+
+    def test_memory_is_bounded_by_capacity(self):
+        self.assertLessEqual(len(self.sketch), 100)
+
+    def test_estimates_are_within_error_bound(self):
+        bound = 0.01 * len(self.data)
+        for item in list(self.exact)[:500]:
+            estimate = self.sketch.estimate(item)
+            self.assertGreaterEqual(estimate, self.exact[item])
+            self.assertLessEqual(estimate, self.exact[item] + bound)
+
+    def test_heavy_hitters_are_candidates(self):
+        self.assertEqual(set(self.sketch.get_top_n_elements(3).get_data()), {7, 8, "x"})
+        self.assertEqual(self.sketch.mode(), 7)
+
+    def test_append_mapping_and_table(self):
+        sketch = SketchFrequencyTable([1, 1, 2])
+        sketch.append({3: 5})
+        sketch.append(DiscreteFrequencyTable([1]))
+        sketch.append([2])
+        self.assertEqual(sketch.to_dict(), {1: 3, 2: 2, 3: 5})
+        self.assertEqual(sketch.get_total(), 10)
+
+    def test_heap_is_bounded_by_capacity(self):
+        sketch = SketchFrequencyTable(epsilon=0.1)
+        for i in range(20000):
+            sketch.append([i % 10])
+        self.assertLessEqual(len(sketch._heap), 2 * sketch._capacity)
+        self.assertEqual(sketch.to_dict(), {i: 2000 for i in range(10)})
+
+    def test_merge_adds_count_matrices(self):
+        parts = [SketchFrequencyTable(self.data[i::3], epsilon=0.01, delta=0.01) for i in range(3)]
+        merged = parts[0]._empty_like()
+        for part in parts:
+            merged.merge(part)
+        self.assertEqual(merged._counts, self.sketch._counts)
+        self.assertEqual(merged.get_total(), len(self.data))
+        self.assertTrue({7, 8, "x"} <= set(merged.get_data()))
+
+    def test_merge_rejects_different_parameters(self):
+        with self.assertRaises(ValueError):
+            self.sketch.merge(SketchFrequencyTable(epsilon=0.1))
+
+    def test_invalid_parameters(self):
+        with self.assertRaises(ValueError):
+            SketchFrequencyTable(epsilon=0)
+        with self.assertRaises(ValueError):
+            SketchFrequencyTable(delta=1)
+
+    def test_derived_tables_are_consistent(self):
+        top = self.sketch.get_top_n_elements(3)
+        self.assertIsInstance(top, DiscreteFrequencyTable)
+        self.assertEqual(top.get_total(), sum(top.get_frequencies()))
+
+        filtered = self.sketch.filter_by_freq(0, 10 ** 9)
+        filtered.append([999])
+        self.assertEqual(filtered.get_total(), sum(filtered.get_frequencies()))
+
+        sample = self.sketch.generate_random_data(100)
+        self.assertEqual(sample.get_total(), 100)
+
+    def test_merge_into_exact_table_keeps_total_consistent(self):
+        sketch = SketchFrequencyTable([n % 1000 for n in range(100000)], epsilon=0.01)
+        table = DiscreteFrequencyTable([1, 2, 3])
+        table.get_total()
+        table.merge(sketch)
+        self.assertEqual(table.get_total(), sum(table.get_frequencies()))
+        table.median()
+
+    def test_unsupported_operations_raise_type_error(self):
+        for operation in (self.sketch.mean, self.sketch.median,
+                          lambda: self.sketch.map_elements(str),
+                          lambda: self.sketch.apply_frequency_operation(abs)):
+            with self.assertRaises(TypeError):
+                operation()
+
+
+if __name__ == "__main__":
+    unittest.main()